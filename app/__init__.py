@@ -7,14 +7,18 @@ from flask import Flask
 from flask_migrate import Migrate
 from sqlalchemy.engine import make_url
 
+from .admission import AdmissionController
 from .ai import get_ai_client
+from .compression import init_compression
+from .context import ConversationContext
 from .db import db, init_db
 from .logging import setup_logging
 from .metabolism import generate_question, get_pending_question
-from .models import LifeformState
 from .routes import create_api_blueprint
 from .scheduler import start_scheduler
+from .serialization import FastJSONProvider
 from .settings import settings
+from .sql_storage import SQLAlchemyRepository
 
 
 def _ensure_sqlite_directory(app: Flask, database_url: str) -> None:
@@ -46,6 +50,7 @@ migrate = Migrate()
 
 def create_app() -> Flask:
     app = Flask(__name__)
+    app.json = FastJSONProvider(app)
     app.config.update(
         SQLALCHEMY_DATABASE_URI=settings.database_url,
         SQLALCHEMY_TRACK_MODIFICATIONS=False,
@@ -63,20 +68,44 @@ def create_app() -> Flask:
     _ensure_sqlite_directory(app, settings.database_url)
     init_db(app)
     migrate.init_app(app, db)
+    if settings.compression_enabled:
+        init_compression(app, settings.compression_min_size, settings.compression_level)
 
     ai_client = get_ai_client(settings.openai_api_key)
     app.config["AI_CLIENT"] = ai_client
-    api_bp = create_api_blueprint(logger, ai_client)
+    repository = SQLAlchemyRepository()
+    app.config["REPOSITORY"] = repository
+    context = ConversationContext(settings.context_max_turns, settings.context_max_chars)
+    app.config["CONVERSATION_CONTEXT"] = context
+    admission = None
+    if settings.admission_enabled:
+        admission = AdmissionController(
+            client_rate=settings.admission_client_rate,
+            client_burst=settings.admission_client_burst,
+            global_rate=settings.admission_global_rate,
+            global_burst=settings.admission_global_burst,
+            max_in_flight=settings.admission_max_in_flight,
+        )
+    app.config["ADMISSION"] = admission
+    api_bp = create_api_blueprint(logger, ai_client, repository, context, admission)
     app.register_blueprint(api_bp)
 
     with app.app_context():
         db.create_all()
-        LifeformState.ensure()
-        if get_pending_question() is None:
-            generate_question(logger, ai_client)
+        repository.ensure_state()
+        context.warm(repository)
+        if get_pending_question(repository) is None:
+            generate_question(logger, ai_client, repository, context)
 
     if settings.environment.lower() != "testing":
-        start_scheduler(app, logger, ai_client, settings.scheduler_interval_seconds)
+        start_scheduler(
+            app,
+            logger,
+            ai_client,
+            repository,
+            settings.scheduler_interval_seconds,
+            context,
+        )
 
     @app.route("/health")
     def healthcheck() -> tuple[str, int]:
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, NamedTuple
+
+
+class TokenBucket:
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float, now: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def take(self, now: float) -> float:
+        """Consume one token; return 0.0 on success or seconds until one is available."""
+
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return 0.0
+        if self.rate <= 0:
+            return math.inf
+        return (1.0 - self.tokens) / self.rate
+
+    def refund(self) -> None:
+        self.tokens = min(self.capacity, self.tokens + 1.0)
+
+
+class Admission(NamedTuple):
+    admitted: bool
+    status: int = 200
+    retry_after: int = 0
+    reason: str = ""
+
+
+class AdmissionController:
+    """Token-bucket rate limits plus an in-flight cap for AI-backed requests.
+
+    Each client gets its own bucket (LRU-bounded to ``max_clients``) and every
+    request also draws from a shared global bucket. Over-eager clients are shed
+    with 429, while global exhaustion or too many concurrent requests yield 503.
+    Callers must ``release()`` every admitted request.
+    All state is per process, so limits apply per worker.
+    """
+
+    def __init__(
+        self,
+        client_rate: float = 1.0,
+        client_burst: int = 5,
+        global_rate: float = 20.0,
+        global_burst: int = 40,
+        max_in_flight: int = 8,
+        max_clients: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if client_burst < 1 or global_burst < 1 or max_in_flight < 1:
+            raise ValueError("burst sizes and max_in_flight must be at least 1")
+        if client_rate < 0 or global_rate < 0:
+            raise ValueError("rates must be non-negative")
+        self.client_rate = client_rate
+        self.client_burst = client_burst
+        self.max_in_flight = max_in_flight
+        self.max_clients = max_clients
+        self._clock = clock
+        self._global = TokenBucket(global_rate, global_burst, clock())
+        self._clients: OrderedDict[str, TokenBucket] = OrderedDict()
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._counters = {
+            "accepted": 0,
+            "shed_client_rate": 0,
+            "shed_global_rate": 0,
+            "shed_in_flight": 0,
+        }
+
+    def acquire(self, client_key: str) -> Admission:
+        with self._lock:
+            now = self._clock()
+            if self._in_flight >= self.max_in_flight:
+                self._counters["shed_in_flight"] += 1
+                return Admission(False, 503, 1, "server busy")
+
+            bucket = self._client_bucket(client_key, now)
+            wait = bucket.take(now)
+            if wait:
+                self._counters["shed_client_rate"] += 1
+                return Admission(False, 429, _retry_after(wait), "rate limit exceeded")
+
+            wait = self._global.take(now)
+            if wait:
+                bucket.refund()
+                self._counters["shed_global_rate"] += 1
+                return Admission(False, 503, _retry_after(wait), "server busy")
+
+            self._in_flight += 1
+            self._counters["accepted"] += 1
+            return Admission(True)
+
+    def release(self) -> None:
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                **self._counters,
+                "in_flight": self._in_flight,
+                "tracked_clients": len(self._clients),
+            }
+
+    def _client_bucket(self, client_key: str, now: float) -> TokenBucket:
+        bucket = self._clients.get(client_key)
+        if bucket is None:
+            bucket = TokenBucket(self.client_rate, self.client_burst, now)
+            self._clients[client_key] = bucket
+            if len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+        else:
+            self._clients.move_to_end(client_key)
+        return bucket
+
+
+def _retry_after(wait: float) -> int:
+    if math.isinf(wait):
+        return 60
+    return max(1, math.ceil(wait))
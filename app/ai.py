@@ -4,19 +4,27 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Optional
 
-from .models import LifeformState, Memory, Question, Reflection
+from .context import ConversationContext
+from .storage import MemoryLike, QuestionLike, ReflectionLike, StateLike
 
 
 class AIClient(ABC):
     @abstractmethod
     def propose_question(
-        self, state: LifeformState, last_reflection: Optional[Reflection]
+        self,
+        state: StateLike,
+        last_reflection: Optional[ReflectionLike],
+        context: Optional[ConversationContext] = None,
     ) -> str:
         raise NotImplementedError
 
     @abstractmethod
     def generate_reflection(
-        self, question: Question, memory: Memory, state: LifeformState
+        self,
+        question: QuestionLike,
+        memory: MemoryLike,
+        state: StateLike,
+        context: Optional[ConversationContext] = None,
     ) -> str:
         raise NotImplementedError
 
@@ -37,14 +45,21 @@ class StubAIClient(AIClient):
     ]
 
     def propose_question(
-        self, state: LifeformState, last_reflection: Optional[Reflection]
+        self,
+        state: StateLike,
+        last_reflection: Optional[ReflectionLike],
+        context: Optional[ConversationContext] = None,
     ) -> str:
         index = int(state.curiosity * 100) % len(self._question_templates)
         template = self._question_templates[index]
         return template.format(mood=state.mood, curiosity=state.curiosity)
 
     def generate_reflection(
-        self, question: Question, memory: Memory, state: LifeformState
+        self,
+        question: QuestionLike,
+        memory: MemoryLike,
+        state: StateLike,
+        context: Optional[ConversationContext] = None,
     ) -> str:
         index = (len(memory.user_reply) + question.id) % len(self._reflection_templates)
         template = self._reflection_templates[index]
@@ -59,16 +74,24 @@ class OpenAIClient(AIClient):
         self.api_key = api_key
 
     def propose_question(
-        self, state: LifeformState, last_reflection: Optional[Reflection]
+        self,
+        state: StateLike,
+        last_reflection: Optional[ReflectionLike],
+        context: Optional[ConversationContext] = None,
     ) -> str:
-        # TODO: Integrate with OpenAI or another LLM service.
-        return StubAIClient().propose_question(state, last_reflection)
+        # TODO: Integrate with OpenAI or another LLM service; send context.render()
+        # as the conversation history.
+        return StubAIClient().propose_question(state, last_reflection, context)
 
     def generate_reflection(
-        self, question: Question, memory: Memory, state: LifeformState
+        self,
+        question: QuestionLike,
+        memory: MemoryLike,
+        state: StateLike,
+        context: Optional[ConversationContext] = None,
     ) -> str:
         # TODO: Integrate with OpenAI or another LLM service.
-        return StubAIClient().generate_reflection(question, memory, state)
+        return StubAIClient().generate_reflection(question, memory, state, context)
 
 
 def get_ai_client(api_key: str | None) -> AIClient:
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import gzip
+import zlib
+from typing import Iterable, Iterator
+
+from flask import Flask, Response, request
+
+COMPRESSIBLE_MIMETYPES = frozenset(
+    {"application/json", "application/x-ndjson", "text/plain", "text/html"}
+)
+
+
+def _gzip_stream(chunks: Iterable[bytes | str], level: int) -> Iterator[bytes]:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.flush()
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+
+
+def compress_response(response: Response, min_size: int, level: int) -> Response:
+    """Gzip ``response`` in place when the client accepts it and it is worth it.
+
+    Buffered bodies are compressed only at or above ``min_size`` bytes; streamed
+    bodies (large list responses) are always compressed chunk by chunk.
+    """
+
+    if (
+        not 200 <= response.status_code < 300
+        or response.status_code == 204
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    if request.accept_encodings["gzip"] <= 0:
+        return response
+
+    if response.is_streamed:
+        response.response = _gzip_stream(response.response, level)
+        response.headers.pop("Content-Length", None)
+        response.headers["Content-Encoding"] = "gzip"
+        return response
+
+    data = response.get_data()
+    if len(data) < min_size:
+        return response
+    compressed = gzip.compress(data, compresslevel=level, mtime=0)
+    if len(compressed) >= len(data):
+        return response
+    response.set_data(compressed)
+    response.headers["Content-Encoding"] = "gzip"
+    return response
+
+
+def init_compression(app: Flask, min_size: int = 1024, level: int = 6) -> None:
+    if min_size < 0:
+        raise ValueError("min_size must be non-negative")
+    if not -1 <= level <= 9:
+        raise ValueError("level must be between -1 and 9")
+
+    @app.after_request
+    def gzip_response(response: Response) -> Response:
+        return compress_response(response, min_size, level)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Iterator, Optional
+
+from .storage import Repository
+
+
+class ContextTurn:
+    __slots__ = ("question_id", "question", "reply", "reflection")
+
+    def __init__(
+        self, question_id: int, question: str, reply: str, reflection: Optional[str] = None
+    ) -> None:
+        self.question_id = question_id
+        self.question = question
+        self.reply = reply
+        self.reflection = reflection
+
+    def size(self) -> int:
+        return len(self.question) + len(self.reply) + len(self.reflection or "")
+
+    def clip(self, budget: int) -> None:
+        """Truncate reply, then reflection, then question so ``size() <= budget``."""
+
+        excess = self.size() - budget
+        if excess > 0 and self.reply:
+            cut = min(excess, len(self.reply))
+            self.reply = self.reply[: len(self.reply) - cut]
+            excess -= cut
+        if excess > 0 and self.reflection:
+            cut = min(excess, len(self.reflection))
+            self.reflection = self.reflection[: len(self.reflection) - cut]
+            excess -= cut
+        if excess > 0:
+            self.question = self.question[: max(0, len(self.question) - excess)]
+
+
+class ConversationContext:
+    """Bounded window of recent question/reply/reflection turns for prompt assembly.
+
+    Warmed once from the repository, then kept current by the metabolism loop so
+    AI clients never query storage for history. The window holds at most
+    ``max_turns`` turns and evicts the oldest ones while the combined text
+    exceeds ``max_chars``; a single turn larger than the budget is truncated.
+    """
+
+    def __init__(self, max_turns: int = 12, max_chars: int = 4000) -> None:
+        if max_turns < 1 or max_chars < 1:
+            raise ValueError("max_turns and max_chars must be at least 1")
+        self.max_turns = max_turns
+        self.max_chars = max_chars
+        self._turns: deque[ContextTurn] = deque()
+        self._chars = 0
+        self._lock = threading.Lock()
+
+    def warm(self, repository: Repository) -> None:
+        turns = [
+            ContextTurn(question_id, question, reply, reflection)
+            for question_id, question, reply, reflection in repository.recent_exchanges(
+                self.max_turns
+            )
+        ]
+        with self._lock:
+            self._turns.clear()
+            self._chars = 0
+            for turn in turns:
+                self._append(turn)
+
+    def record_reply(self, question_id: int, question: str, reply: str) -> None:
+        with self._lock:
+            self._append(ContextTurn(question_id, question, reply))
+
+    def record_reflection(self, question_id: int, reflection: str) -> None:
+        with self._lock:
+            for turn in reversed(self._turns):
+                if turn.question_id == question_id:
+                    self._chars += len(reflection) - len(turn.reflection or "")
+                    turn.reflection = reflection
+                    self._trim()
+                    return
+
+    def turns(self) -> list[ContextTurn]:
+        with self._lock:
+            return list(self._turns)
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for turn in self.turns():
+            lines.append(f"Q: {turn.question}")
+            lines.append(f"A: {turn.reply}")
+            if turn.reflection:
+                lines.append(f"R: {turn.reflection}")
+        return "\n".join(lines)
+
+    def __len__(self) -> int:
+        return len(self._turns)
+
+    def __iter__(self) -> Iterator[ContextTurn]:
+        return iter(self.turns())
+
+    @property
+    def chars(self) -> int:
+        return self._chars
+
+    def _append(self, turn: ContextTurn) -> None:
+        self._turns.append(turn)
+        self._chars += turn.size()
+        self._trim()
+
+    def _trim(self) -> None:
+        while len(self._turns) > self.max_turns or (
+            self._chars > self.max_chars and len(self._turns) > 1
+        ):
+            self._chars -= self._turns.popleft().size()
+        if self._chars > self.max_chars and self._turns:
+            turn = self._turns[0]
+            turn.clip(self.max_chars)
+            self._chars = turn.size()
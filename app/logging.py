@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 from __future__ import annotations
 
-import json
 import logging
 from logging import Logger
 from logging.handlers import RotatingFileHandler
@@ -11,6 +10,7 @@ from typing import Any
 from rich.console import Console
 from rich.logging import RichHandler
 
+from .serialization import dumps
 from .settings import Settings
 
 
@@ -32,7 +32,7 @@ class JSONLinesFormatter(logging.Formatter):
             }
             if extras:
                 payload.update(extras)
-        return json.dumps(payload, default=str)
+        return dumps(payload, default=str).decode("utf-8")
 
 
 def setup_logging(settings: Settings) -> Logger:
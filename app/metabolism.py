@@ -4,45 +4,45 @@ from __future__ import annotations
 import logging
 from datetime import datetime
 
-from sqlalchemy import select
-
 from .ai import AIClient
-from .db import db
-from .models import LifeformState, Memory, Question, Reflection
+from .context import ConversationContext
+from .storage import MemoryLike, QuestionLike, ReflectionLike, Repository, StateLike
 
 MOODS = ["curious", "playful", "thoughtful", "grounded", "radiant"]
 
 
-def get_latest_reflection() -> Reflection | None:
-    stmt = select(Reflection).order_by(Reflection.created_at.desc())
-    return db.session.execute(stmt).scalars().first()
+def get_latest_reflection(repository: Repository) -> ReflectionLike | None:
+    return repository.get_latest_reflection()
 
 
-def get_pending_question() -> Question | None:
-    stmt = select(Question).where(Question.status == "pending").order_by(Question.created_at.asc())
-    return db.session.execute(stmt).scalars().first()
+def get_pending_question(repository: Repository) -> QuestionLike | None:
+    return repository.get_pending_question()
 
 
 def clamp(value: float, minimum: float, maximum: float) -> float:
     return max(minimum, min(value, maximum))
 
 
-def generate_question(logger: logging.Logger, ai_client: AIClient) -> Question:
-    state = LifeformState.ensure()
-    existing = get_pending_question()
+def generate_question(
+    logger: logging.Logger,
+    ai_client: AIClient,
+    repository: Repository,
+    context: ConversationContext | None = None,
+) -> QuestionLike:
+    state = repository.ensure_state()
+    existing = repository.get_pending_question()
     if existing:
         return existing
 
-    last_reflection = get_latest_reflection()
-    text = ai_client.propose_question(state, last_reflection)
-    question = Question(text=text, status="pending")
-    db.session.add(question)
-    db.session.commit()
+    last_reflection = repository.get_latest_reflection()
+    text = ai_client.propose_question(state, last_reflection, context)
+    question = repository.add_question(text)
+    repository.commit()
     logger.info("question.generated", extra={"question_id": question.id, "text": question.text})
     return question
 
 
-def _update_state_from_reply(state: LifeformState, memory: Memory) -> None:
+def _update_state_from_reply(state: StateLike, memory: MemoryLike) -> None:
     content = memory.user_reply.strip().lower()
     length = len(content)
     delta = clamp((length - 120) / 800.0, -0.08, 0.08)
@@ -64,15 +64,18 @@ def _update_state_from_reply(state: LifeformState, memory: Memory) -> None:
 def reflect_on_memory(
     logger: logging.Logger,
     ai_client: AIClient,
-    question: Question,
-    memory: Memory,
-    state: LifeformState,
-) -> Reflection:
-    reflection_text = ai_client.generate_reflection(question, memory, state)
-    reflection = Reflection(question_id=question.id, text=reflection_text)
-    db.session.add(reflection)
+    repository: Repository,
+    question: QuestionLike,
+    memory: MemoryLike,
+    state: StateLike,
+    context: ConversationContext | None = None,
+) -> ReflectionLike:
+    reflection_text = ai_client.generate_reflection(question, memory, state, context)
+    reflection = repository.add_reflection(question, reflection_text)
     _update_state_from_reply(state, memory)
-    db.session.commit()
+    repository.commit()
+    if context is not None:
+        context.record_reflection(question.id, reflection_text)
     logger.info(
         "reflection.created",
         extra={
@@ -85,38 +88,49 @@ def reflect_on_memory(
     return reflection
 
 
-def ingest_reply(logger: logging.Logger, ai_client: AIClient, question_id: int, text: str) -> dict[str, object]:
-    question = db.session.get(Question, question_id)
+def ingest_reply(
+    logger: logging.Logger,
+    ai_client: AIClient,
+    repository: Repository,
+    question_id: int,
+    text: str,
+    context: ConversationContext | None = None,
+) -> dict[str, object]:
+    question = repository.get_question(question_id)
     if question is None or question.status != "pending":
         raise ValueError("Question not found or already answered")
 
-    state = LifeformState.ensure()
+    state = repository.ensure_state()
 
-    memory = Memory(question_id=question.id, user_reply=text)
-    db.session.add(memory)
-    question.status = "answered"
-    db.session.commit()
+    memory = repository.add_memory(question, text)
+    repository.mark_answered(question)
+    repository.commit()
+    if context is not None:
+        context.record_reply(question.id, question.text, text)
 
     logger.info(
         "reply.ingested",
         extra={"question_id": question.id, "memory_id": memory.id, "length": len(text)},
     )
 
-    reflection = reflect_on_memory(logger, ai_client, question, memory, state)
+    reflection = reflect_on_memory(
+        logger, ai_client, repository, question, memory, state, context
+    )
 
-    pending = get_pending_question()
+    pending = repository.get_pending_question()
     if pending is None:
-        pending = generate_question(logger, ai_client)
+        pending = generate_question(logger, ai_client, repository, context)
 
-    return build_state_payload(state, pending, reflection)
+    return build_state_payload(repository, state, pending, reflection)
 
 
 def build_state_payload(
-    state: LifeformState,
-    pending_question: Question | None,
-    last_reflection: Reflection | None,
+    repository: Repository,
+    state: StateLike,
+    pending_question: QuestionLike | None,
+    last_reflection: ReflectionLike | None,
 ) -> dict[str, object]:
-    memories_count = db.session.scalar(select(db.func.count(Memory.id))) or 0
+    memories_count = repository.count_memories()
     return {
         "pending_question":
             {
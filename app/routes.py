@@ -2,11 +2,14 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from functools import wraps
+from typing import Any, Callable
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request
 
+from .admission import AdmissionController
 from .ai import AIClient
+from .context import ConversationContext
 from .metabolism import (
     build_state_payload,
     generate_question,
@@ -14,22 +17,81 @@ from .metabolism import (
     get_pending_question,
     ingest_reply,
 )
-from .models import LifeformState
+from .serialization import iter_json_array
+from .storage import Repository
 
+HISTORY_DEFAULT_LIMIT = 50
+HISTORY_MAX_LIMIT = 500
 
-def create_api_blueprint(logger: logging.Logger, ai_client: AIClient) -> Blueprint:
+
+def create_api_blueprint(
+    logger: logging.Logger,
+    ai_client: AIClient,
+    repository: Repository,
+    context: ConversationContext | None = None,
+    admission: AdmissionController | None = None,
+) -> Blueprint:
     blueprint = Blueprint("api", __name__)
 
+    def admitted(view: Callable[..., Any]) -> Callable[..., Any]:
+        """Shed AI-backed requests early when the admission controller is saturated."""
+
+        @wraps(view)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if admission is None:
+                return view(*args, **kwargs)
+            client_key = request.remote_addr or "unknown"
+            decision = admission.acquire(client_key)
+            if not decision.admitted:
+                logger.warning(
+                    "admission.shed",
+                    extra={
+                        "client": client_key,
+                        "path": request.path,
+                        "status": decision.status,
+                        "retry_after": decision.retry_after,
+                    },
+                )
+                response = jsonify({"error": decision.reason})
+                response.status_code = decision.status
+                response.headers["Retry-After"] = str(decision.retry_after)
+                return response
+            try:
+                return view(*args, **kwargs)
+            finally:
+                admission.release()
+
+        return wrapper
+
     @blueprint.get("/api/state")
     def read_state():
-        state = LifeformState.ensure()
-        pending = get_pending_question()
+        state = repository.ensure_state()
+        pending = get_pending_question(repository)
         if pending is None:
-            pending = generate_question(logger, ai_client)
-        payload = build_state_payload(state, pending, get_latest_reflection())
+            pending = generate_question(logger, ai_client, repository, context)
+        payload = build_state_payload(
+            repository, state, pending, get_latest_reflection(repository)
+        )
         return jsonify(payload)
 
+    @blueprint.get("/api/history")
+    def read_history():
+        limit = request.args.get("limit", HISTORY_DEFAULT_LIMIT, type=int)
+        limit = max(1, min(limit, HISTORY_MAX_LIMIT))
+        # The query runs here; building and encoding each item is deferred to the stream.
+        items = (
+            {
+                "question_id": question_id,
+                "question": question,
+                "reply": reply,
+                "reflection": reflection,
+            }
+            for question_id, question, reply, reflection in repository.recent_exchanges(limit)
+        )
+        return Response(iter_json_array(items), mimetype="application/json")
+
     @blueprint.post("/api/reply")
+    @admitted
     def post_reply():
         data: dict[str, Any] = request.get_json(force=True, silent=False) or {}
         question_id = data.get("question_id")
@@ -39,18 +101,27 @@ def create_api_blueprint(logger: logging.Logger, ai_client: AIClient) -> Bluepri
         if not text:
             return jsonify({"error": "text must be provided"}), 400
         try:
-            payload = ingest_reply(logger, ai_client, question_id, text)
+            payload = ingest_reply(logger, ai_client, repository, question_id, text, context)
         except ValueError as exc:
             return jsonify({"error": str(exc)}), 400
         return jsonify(payload)
 
     @blueprint.post("/api/admin/seed")
+    @admitted
     def seed_state():
-        state = LifeformState.ensure()
-        question = generate_question(logger, ai_client)
-        payload = build_state_payload(state, question, get_latest_reflection())
+        state = repository.ensure_state()
+        question = generate_question(logger, ai_client, repository, context)
+        payload = build_state_payload(
+            repository, state, question, get_latest_reflection(repository)
+        )
         return jsonify(payload), 201
 
+    @blueprint.get("/api/admin/admission")
+    def admission_stats():
+        if admission is None:
+            return jsonify({"enabled": False})
+        return jsonify({"enabled": True, **admission.snapshot()})
+
     @blueprint.post("/hooks/twilio/sms")
     def twilio_sms():
         payload = request.form.to_dict()
@@ -7,16 +7,25 @@ from apscheduler.triggers.interval import IntervalTrigger
 from flask import Flask
 
 from .ai import AIClient
+from .context import ConversationContext
 from .metabolism import generate_question
+from .storage import Repository
 
 
-def start_scheduler(app: Flask, logger: logging.Logger, ai_client: AIClient, interval_seconds: int) -> BackgroundScheduler:
+def start_scheduler(
+    app: Flask,
+    logger: logging.Logger,
+    ai_client: AIClient,
+    repository: Repository,
+    interval_seconds: int,
+    context: ConversationContext | None = None,
+) -> BackgroundScheduler:
     scheduler = BackgroundScheduler()
 
     def scheduled_job() -> None:
         with app.app_context():
             logger.info("scheduler.tick")
-            generate_question(logger, ai_client)
+            generate_question(logger, ai_client, repository, context)
 
     scheduler.add_job(
         scheduled_job,
@@ -15,6 +15,7 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        populate_by_name=True,
     )
 
     app_name: str = Field(default="AI Lifeform")
@@ -29,6 +30,20 @@ class Settings(BaseSettings):
     logging_file_path: str = Field(default="logs/app.jsonl", alias="LOG_FILE_PATH")
     logging_console_rich: bool = Field(default=True, alias="LOG_CONSOLE_RICH")
 
+    context_max_turns: int = Field(default=12, ge=1, alias="CONTEXT_MAX_TURNS")
+    context_max_chars: int = Field(default=4000, ge=1, alias="CONTEXT_MAX_CHARS")
+
+    admission_enabled: bool = Field(default=True, alias="ADMISSION_ENABLED")
+    admission_client_rate: float = Field(default=1.0, ge=0, alias="ADMISSION_CLIENT_RATE")
+    admission_client_burst: int = Field(default=5, ge=1, alias="ADMISSION_CLIENT_BURST")
+    admission_global_rate: float = Field(default=20.0, ge=0, alias="ADMISSION_GLOBAL_RATE")
+    admission_global_burst: int = Field(default=40, ge=1, alias="ADMISSION_GLOBAL_BURST")
+    admission_max_in_flight: int = Field(default=8, ge=1, alias="ADMISSION_MAX_IN_FLIGHT")
+
+    compression_enabled: bool = Field(default=True, alias="COMPRESSION_ENABLED")
+    compression_min_size: int = Field(default=1024, ge=0, alias="COMPRESSION_MIN_SIZE")
+    compression_level: int = Field(default=6, ge=-1, le=9, alias="COMPRESSION_LEVEL")
+
     config_path: Path = Field(default=Path("config.toml"), alias="CONFIG_PATH")
 
     @classmethod
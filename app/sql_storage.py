@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from .db import db
+from .models import LifeformState, Memory, Question, Reflection
+from .storage import Exchange, QuestionLike, Repository
+
+
+class SQLAlchemyRepository(Repository):
+    """Repository backed by the Flask-SQLAlchemy session; needs an app context."""
+
+    def ensure_state(self) -> LifeformState:
+        return LifeformState.ensure()
+
+    def get_question(self, question_id: int) -> Question | None:
+        return db.session.get(Question, question_id)
+
+    def get_pending_question(self) -> Question | None:
+        stmt = (
+            select(Question)
+            .where(Question.status == "pending")
+            .order_by(Question.created_at.asc())
+        )
+        return db.session.execute(stmt).scalars().first()
+
+    def get_latest_reflection(self) -> Reflection | None:
+        stmt = select(Reflection).order_by(Reflection.created_at.desc())
+        return db.session.execute(stmt).scalars().first()
+
+    def count_memories(self) -> int:
+        return int(db.session.scalar(select(db.func.count(Memory.id))) or 0)
+
+    def recent_exchanges(self, limit: int) -> list[Exchange]:
+        stmt = (
+            select(Memory)
+            .options(selectinload(Memory.question).selectinload(Question.reflection))
+            .order_by(Memory.created_at.desc(), Memory.id.desc())
+            .limit(limit)
+        )
+        memories = db.session.execute(stmt).scalars().all()
+        return [
+            (
+                memory.question_id,
+                memory.question.text,
+                memory.user_reply,
+                memory.question.reflection.text if memory.question.reflection else None,
+            )
+            for memory in reversed(memories)
+        ]
+
+    def add_question(self, text: str) -> Question:
+        question = Question(text=text, status="pending")
+        db.session.add(question)
+        return question
+
+    def add_memory(self, question: QuestionLike, user_reply: str) -> Memory:
+        memory = Memory(question_id=question.id, user_reply=user_reply)
+        db.session.add(memory)
+        return memory
+
+    def add_reflection(self, question: QuestionLike, text: str) -> Reflection:
+        reflection = Reflection(question_id=question.id, text=text)
+        db.session.add(reflection)
+        return reflection
+
+    def mark_answered(self, question: QuestionLike) -> None:
+        question.status = "answered"
+
+    def commit(self) -> None:
+        db.session.commit()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional, Protocol
+
+# Structural types for what the metabolism loop reads and writes; the ORM
+# models and the slotted records below both satisfy them.
+
+
+class QuestionLike(Protocol):
+    @property
+    def id(self) -> int: ...
+
+    @property
+    def text(self) -> str: ...
+
+    status: str
+
+
+class MemoryLike(Protocol):
+    @property
+    def id(self) -> int: ...
+
+    @property
+    def question_id(self) -> int: ...
+
+    @property
+    def user_reply(self) -> str: ...
+
+
+class ReflectionLike(Protocol):
+    @property
+    def id(self) -> int: ...
+
+    @property
+    def text(self) -> str: ...
+
+
+class StateLike(Protocol):
+    mood: str
+    curiosity: float
+    last_reflected_at: Optional[datetime]
+
+
+class QuestionRecord:
+    __slots__ = ("id", "text", "status", "created_at")
+
+    def __init__(self, id: int, text: str, status: str = "pending") -> None:
+        self.id = id
+        self.text = text
+        self.status = status
+        self.created_at = datetime.utcnow()
+
+
+class MemoryRecord:
+    __slots__ = ("id", "question_id", "user_reply", "created_at")
+
+    def __init__(self, id: int, question_id: int, user_reply: str) -> None:
+        self.id = id
+        self.question_id = question_id
+        self.user_reply = user_reply
+        self.created_at = datetime.utcnow()
+
+
+class ReflectionRecord:
+    __slots__ = ("id", "question_id", "text", "created_at")
+
+    def __init__(self, id: int, question_id: int, text: str) -> None:
+        self.id = id
+        self.question_id = question_id
+        self.text = text
+        self.created_at = datetime.utcnow()
+
+
+class StateRecord:
+    __slots__ = ("id", "mood", "curiosity", "last_reflected_at")
+
+    def __init__(self, mood: str = "curious", curiosity: float = 0.5) -> None:
+        self.id = 1
+        self.mood = mood
+        self.curiosity = curiosity
+        self.last_reflected_at: Optional[datetime] = None
+
+
+Exchange = tuple[int, str, str, Optional[str]]
+
+
+class Repository(ABC):
+    """Storage operations the metabolism loop depends on."""
+
+    @abstractmethod
+    def ensure_state(self) -> StateLike:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_question(self, question_id: int) -> QuestionLike | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_pending_question(self) -> QuestionLike | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_latest_reflection(self) -> ReflectionLike | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_memories(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def recent_exchanges(self, limit: int) -> list[Exchange]:
+        """Return up to ``limit`` (question_id, question, reply, reflection) rows, oldest first."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_question(self, text: str) -> QuestionLike:
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_memory(self, question: QuestionLike, user_reply: str) -> MemoryLike:
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_reflection(self, question: QuestionLike, text: str) -> ReflectionLike:
+        raise NotImplementedError
+
+    @abstractmethod
+    def mark_answered(self, question: QuestionLike) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def commit(self) -> None:
+        raise NotImplementedError
+
+
+class InMemoryRepository(Repository):
+    """Append-only, process-local repository for tests and offline simulation.
+
+    Records live in plain lists indexed by ``id - 1``; pending questions are
+    tracked in an insertion-ordered dict so the oldest one is found in O(1).
+    """
+
+    def __init__(self) -> None:
+        self._state = StateRecord()
+        self._questions: list[QuestionRecord] = []
+        self._memories: list[MemoryRecord] = []
+        self._reflections: list[ReflectionRecord] = []
+        self._reflection_by_question: dict[int, ReflectionRecord] = {}
+        self._pending: dict[int, None] = {}
+
+    def ensure_state(self) -> StateRecord:
+        return self._state
+
+    def get_question(self, question_id: int) -> QuestionRecord | None:
+        if 0 < question_id <= len(self._questions):
+            return self._questions[question_id - 1]
+        return None
+
+    def get_pending_question(self) -> QuestionRecord | None:
+        for question_id in self._pending:
+            return self._questions[question_id - 1]
+        return None
+
+    def get_latest_reflection(self) -> ReflectionRecord | None:
+        return self._reflections[-1] if self._reflections else None
+
+    def count_memories(self) -> int:
+        return len(self._memories)
+
+    def recent_exchanges(self, limit: int) -> list[Exchange]:
+        exchanges: list[Exchange] = []
+        for memory in self._memories[-limit:] if limit > 0 else []:
+            reflection = self._reflection_by_question.get(memory.question_id)
+            exchanges.append(
+                (
+                    memory.question_id,
+                    self._questions[memory.question_id - 1].text,
+                    memory.user_reply,
+                    reflection.text if reflection else None,
+                )
+            )
+        return exchanges
+
+    def add_question(self, text: str) -> QuestionRecord:
+        question = QuestionRecord(len(self._questions) + 1, text)
+        self._questions.append(question)
+        self._pending[question.id] = None
+        return question
+
+    def add_memory(self, question: QuestionLike, user_reply: str) -> MemoryRecord:
+        memory = MemoryRecord(len(self._memories) + 1, question.id, user_reply)
+        self._memories.append(memory)
+        return memory
+
+    def add_reflection(self, question: QuestionLike, text: str) -> ReflectionRecord:
+        reflection = ReflectionRecord(len(self._reflections) + 1, question.id, text)
+        self._reflections.append(reflection)
+        self._reflection_by_question[question.id] = reflection
+        return reflection
+
+    def mark_answered(self, question: QuestionLike) -> None:
+        question.status = "answered"
+        self._pending.pop(question.id, None)
+
+    def commit(self) -> None:
+        return None
+
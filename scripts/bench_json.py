@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import logging
+import timeit
+from typing import Any, Callable
+
+from app.ai import StubAIClient
+from app.metabolism import build_state_payload, generate_question, ingest_reply
+from app.serialization import dumps, orjson
+from app.storage import InMemoryRepository
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare JSON encode time and bytes on the wire for API payloads."
+    )
+    parser.add_argument("--page-size", type=int, default=500, help="history items per page")
+    parser.add_argument("-n", "--number", type=int, default=2_000, help="encodes per measurement")
+    parser.add_argument("--level", type=int, default=6, help="gzip compression level")
+    return parser.parse_args()
+
+
+def build_fixtures(page_size: int) -> dict[str, Any]:
+    logger = logging.getLogger("lifeform.bench")
+    logger.setLevel(logging.WARNING)
+    ai_client = StubAIClient()
+    repository = InMemoryRepository()
+    for tick in range(page_size):
+        question = generate_question(logger, ai_client, repository)
+        ingest_reply(logger, ai_client, repository, question.id, f"reply number {tick} " * 4)
+
+    state = repository.ensure_state()
+    pending = generate_question(logger, ai_client, repository)
+    history = [
+        {"question_id": question_id, "question": question, "reply": reply, "reflection": reflection}
+        for question_id, question, reply, reflection in repository.recent_exchanges(page_size)
+    ]
+    return {
+        "state_payload": build_state_payload(
+            repository, state, pending, repository.get_latest_reflection()
+        ),
+        "history_page": history,
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    fixtures = build_fixtures(args.page_size)
+    encoders: dict[str, Callable[[Any], bytes]] = {
+        "stdlib (flask default)": lambda obj: json.dumps(
+            obj, sort_keys=True, separators=(",", ":")
+        ).encode("utf-8"),
+        f"fast ({'orjson' if orjson else 'stdlib fallback'})": dumps,
+    }
+
+    header = f"{'payload':<14} {'encoder':<24} {'us/encode':>10} {'raw bytes':>10} {'gzip bytes':>10}"
+    print(header)
+    print("-" * len(header))
+    for name, obj in fixtures.items():
+        for label, encode in encoders.items():
+            seconds = timeit.timeit(lambda: encode(obj), number=args.number)
+            body = encode(obj)
+            compressed = gzip.compress(body, compresslevel=args.level, mtime=0)
+            print(
+                f"{name:<14} {label:<24} {seconds / args.number * 1e6:>10.1f} "
+                f"{len(body):>10} {len(compressed):>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
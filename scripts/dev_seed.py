@@ -3,22 +3,23 @@ from __future__ import annotations
 
 from app import create_app
 from app.metabolism import generate_question, get_pending_question
-from app.models import LifeformState
 from app.settings import settings
+from app.sql_storage import SQLAlchemyRepository
 
 
 def main() -> None:
     app = create_app()
     with app.app_context():
-        LifeformState.ensure()
-        if get_pending_question() is None:
+        repository = app.config.get("REPOSITORY") or SQLAlchemyRepository()
+        repository.ensure_state()
+        if get_pending_question(repository) is None:
             logger = app.logger
             ai_client = app.config.get("AI_CLIENT")
             if ai_client is None:
                 from app.ai import get_ai_client
 
                 ai_client = get_ai_client(settings.openai_api_key)
-            generate_question(logger, ai_client)
+            generate_question(logger, ai_client, repository, app.config.get("CONVERSATION_CONTEXT"))
     print("Seed complete.")
 
 
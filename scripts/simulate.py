@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+
+from app.ai import StubAIClient
+from app.context import ConversationContext
+from app.metabolism import generate_question, ingest_reply
+from app.storage import InMemoryRepository
+
+SAMPLE_REPLIES = [
+    "I took a slow walk and felt calm and grounded.",
+    "A spark of joy came from a song I had not heard in years!",
+    "I want to reflect on what I learn from small failures.",
+    "Nothing much, just a quiet afternoon.",
+    "I am excited about a new project that keeps pulling me back to the desk "
+    "and makes me wonder what else I could build if I had a little more time.",
+]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Run the metabolism loop against the in-memory repository."
+    )
+    parser.add_argument("-n", "--cycles", type=int, default=10_000, help="reply/reflect cycles to run")
+    parser.add_argument("-v", "--verbose", action="store_true", help="emit per-tick log lines")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+    logger = logging.getLogger("lifeform.simulate")
+    ai_client = StubAIClient()
+    repository = InMemoryRepository()
+    context = ConversationContext()
+
+    question = generate_question(logger, ai_client, repository, context)
+    started = time.perf_counter()
+    payload: dict[str, object] = {}
+    for tick in range(args.cycles):
+        reply = SAMPLE_REPLIES[tick % len(SAMPLE_REPLIES)]
+        payload = ingest_reply(logger, ai_client, repository, question.id, reply, context)
+        question = repository.get_pending_question() or generate_question(
+            logger, ai_client, repository, context
+        )
+    elapsed = time.perf_counter() - started
+
+    rate = args.cycles / elapsed if elapsed else float("inf")
+    print(f"cycles={args.cycles} elapsed={elapsed:.3f}s rate={rate:,.0f}/s")
+    print(f"memories={repository.count_memories()} state={payload.get('state')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,49 @@
 from __future__ import annotations
 
+import logging
 import sys
 from pathlib import Path
+from typing import Callable, Optional
+
+import pytest
 
 ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+from app.ai import StubAIClient  # noqa: E402
+from app.context import ConversationContext  # noqa: E402
+from app.metabolism import generate_question, ingest_reply  # noqa: E402
+from app.storage import InMemoryRepository  # noqa: E402
+
+
+@pytest.fixture
+def test_logger() -> logging.Logger:
+    return logging.getLogger("test")
+
+
+@pytest.fixture
+def stub_ai_client() -> StubAIClient:
+    return StubAIClient()
+
+
+@pytest.fixture
+def seeded_repository(
+    test_logger: logging.Logger, stub_ai_client: StubAIClient
+) -> Callable[..., InMemoryRepository]:
+    """Return a factory that runs ``cycles`` reply/reflect cycles on an in-memory repository."""
+
+    def seed(
+        cycles: int = 0,
+        *,
+        replies: Optional[list[str]] = None,
+        context: Optional[ConversationContext] = None,
+    ) -> InMemoryRepository:
+        repository = InMemoryRepository()
+        for tick in range(cycles):
+            reply = replies[tick % len(replies)] if replies else f"reply {tick}"
+            question = generate_question(test_logger, stub_ai_client, repository, context)
+            ingest_reply(test_logger, stub_ai_client, repository, question.id, reply, context)
+        return repository
+
+    return seed
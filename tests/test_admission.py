@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import pytest
+from flask import Flask
+
+from app.admission import AdmissionController
+from app.routes import create_api_blueprint
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_client_bucket_sheds_with_retry_after_and_refills() -> None:
+    clock = FakeClock()
+    controller = AdmissionController(
+        client_rate=0.5, client_burst=2, global_rate=100, global_burst=100, clock=clock
+    )
+
+    assert controller.acquire("a").admitted
+    controller.release()
+    assert controller.acquire("a").admitted
+    controller.release()
+
+    shed = controller.acquire("a")
+    assert (shed.admitted, shed.status, shed.retry_after) == (False, 429, 2)
+    assert controller.acquire("b").admitted
+    controller.release()
+
+    clock.now = 2.0
+    assert controller.acquire("a").admitted
+    controller.release()
+    assert controller.snapshot()["shed_client_rate"] == 1
+
+
+def test_global_bucket_and_in_flight_cap_return_503() -> None:
+    clock = FakeClock()
+    controller = AdmissionController(global_rate=1, global_burst=1, max_in_flight=1, clock=clock)
+
+    assert controller.acquire("a").admitted
+    busy = controller.acquire("b")
+    assert (busy.admitted, busy.status) == (False, 503)
+    controller.release()
+
+    drained = controller.acquire("b")
+    assert (drained.admitted, drained.status, drained.retry_after) == (False, 503, 1)
+
+    stats = controller.snapshot()
+    assert stats["accepted"] == 1
+    assert stats["shed_in_flight"] == 1
+    assert stats["shed_global_rate"] == 1
+    assert stats["in_flight"] == 0
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"client_burst": 0}, {"global_burst": 0}, {"max_in_flight": 0}, {"client_rate": -1.0}],
+)
+def test_controller_rejects_invalid_limits(kwargs) -> None:
+    with pytest.raises(ValueError):
+        AdmissionController(**kwargs)
+
+
+def test_seed_endpoint_returns_429_when_client_is_over_budget(
+    test_logger, stub_ai_client, seeded_repository
+) -> None:
+    app = Flask(__name__)
+    admission = AdmissionController(client_rate=0.0, client_burst=1)
+    app.register_blueprint(
+        create_api_blueprint(
+            test_logger, stub_ai_client, seeded_repository(), admission=admission
+        )
+    )
+    client = app.test_client()
+
+    assert client.post("/api/admin/seed").status_code == 201
+    response = client.post("/api/admin/seed")
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "60"
+    assert client.get("/api/admin/admission").get_json()["shed_client_rate"] == 1
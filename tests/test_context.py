@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import pytest
+
+from app.context import ConversationContext
+
+
+def test_context_tracks_recent_turns_incrementally(seeded_repository) -> None:
+    context = ConversationContext(max_turns=3, max_chars=10_000)
+
+    seeded_repository(5, context=context)
+
+    turns = context.turns()
+    assert [turn.reply for turn in turns] == ["reply 2", "reply 3", "reply 4"]
+    assert all(turn.reflection for turn in turns)
+    assert context.chars == sum(turn.size() for turn in turns)
+
+
+def test_context_trims_to_char_budget_and_warms_from_repository(seeded_repository) -> None:
+    repository = seeded_repository(4, replies=["x" * 50])
+
+    context = ConversationContext(max_turns=10, max_chars=500)
+    context.warm(repository)
+
+    assert len(context) == 2
+    assert context.chars <= 500
+    assert context.turns()[-1].question_id == 4
+    assert "A: " + "x" * 50 in context.render()
+
+
+def test_context_truncates_single_turn_over_budget() -> None:
+    context = ConversationContext(max_turns=5, max_chars=100)
+    context.record_reply(1, "earlier question", "earlier reply")
+    context.record_reply(2, "q", "x" * 50_000)
+
+    assert len(context) == 1
+    assert context.chars == 100
+    assert context.turns()[0].reply == "x" * 99
+    assert len(context.render()) <= 100 + len("Q: \nA: ")
+
+    context.record_reflection(2, "r" * 500)
+    assert context.chars == 100
+    assert context.turns()[0].question == "q"
+
+
+@pytest.mark.parametrize("kwargs", [{"max_turns": 0}, {"max_chars": 0}, {"max_chars": -5}])
+def test_context_rejects_invalid_limits(kwargs) -> None:
+    with pytest.raises(ValueError):
+        ConversationContext(**kwargs)
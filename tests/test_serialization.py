@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import gzip
+import json
+from datetime import datetime
+
+import pytest
+from flask import Flask, jsonify
+
+from app.compression import init_compression
+from app.routes import create_api_blueprint
+from app.serialization import FastJSONProvider, dumps, iter_json_array
+from app.storage import InMemoryRepository
+
+
+@pytest.fixture
+def build_app(test_logger, stub_ai_client, seeded_repository):
+    def build(min_size: int = 256) -> tuple[Flask, InMemoryRepository]:
+        repository = seeded_repository(20)
+        app = Flask(__name__)
+        app.json = FastJSONProvider(app)
+        app.register_blueprint(create_api_blueprint(test_logger, stub_ai_client, repository))
+        init_compression(app, min_size=min_size)
+
+        @app.get("/echo")
+        def echo():
+            return jsonify({"when": datetime(2024, 1, 2, 3, 4, 5), "text": "é" * 10})
+
+        return app, repository
+
+    return build
+
+
+def test_dumps_and_streamed_array_match_stdlib(monkeypatch) -> None:
+    data = [{"id": index, 1: "x", "nested": [1.5, None, True]} for index in range(7)]
+
+    assert json.loads(dumps(data, default=str)) == json.loads(json.dumps(data))
+    assert json.loads(b"".join(iter_json_array(data, chunk_size=3))) == json.loads(json.dumps(data))
+    assert b"".join(iter_json_array([])) == b"[]\n"
+
+    monkeypatch.setattr("app.serialization.orjson", None)
+    assert json.loads(dumps(data, default=str)) == json.loads(json.dumps(data))
+    assert json.loads(dumps({"big": 2**70})) == {"big": 2**70}
+
+
+def test_provider_keeps_flask_datetime_format(build_app) -> None:
+    app, _ = build_app()
+    response = app.test_client().get("/echo")
+
+    assert response.get_json() == {"when": "Tue, 02 Jan 2024 03:04:05 GMT", "text": "é" * 10}
+    assert "Content-Encoding" not in response.headers
+
+
+def test_history_is_gzip_streamed_when_accepted(build_app) -> None:
+    app, repository = build_app()
+    client = app.test_client()
+
+    plain = client.get("/api/history?limit=5")
+    assert "Content-Encoding" not in plain.headers
+    assert [item["question_id"] for item in plain.get_json()] == [16, 17, 18, 19, 20]
+
+    response = client.get("/api/history?limit=500", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    items = json.loads(gzip.decompress(response.get_data()))
+    assert len(items) == repository.count_memories() == 20
+
+
+def test_buffered_responses_compress_only_above_threshold(build_app) -> None:
+    app, _ = build_app(min_size=10_000)
+    client = app.test_client()
+    small = client.get("/api/state", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in small.headers
+
+    app, _ = build_app(min_size=64)
+    client = app.test_client()
+    large = client.get("/api/state", headers={"Accept-Encoding": "gzip"})
+    assert large.headers["Content-Encoding"] == "gzip"
+    assert "state" in json.loads(gzip.decompress(large.get_data()))
+
+
+def test_provider_dumps_honours_separators_and_indent(build_app) -> None:
+    app, _ = build_app()
+    data = {"a": [1, 2]}
+
+    assert app.json.dumps(data, separators=(", ", "= ")) == json.dumps(data, separators=(", ", "= "))
+    assert app.json.dumps(data, indent=4) == json.dumps(data, indent=4, ensure_ascii=False)
+    assert app.json.dumps(data, indent=2) == json.dumps(data, indent=2)
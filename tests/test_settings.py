@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from textwrap import dedent
 
+import pytest
+from pydantic import ValidationError
+
 from app.settings import Settings
 
 
@@ -23,3 +26,47 @@ def test_settings_loads_from_toml(tmp_path, monkeypatch):
     assert settings.app_name == "Test App"
     assert settings.logging_level == "DEBUG"
     assert settings.config_path == config_path
+
+
+def test_settings_toml_field_names_apply_and_env_aliases_override(tmp_path, monkeypatch):
+    config_contents = dedent(
+        """
+        [app]
+        port = 9001
+
+        [context]
+        context_max_turns = 3
+        context_max_chars = 1234
+        """
+    ).strip()
+    config_path = tmp_path / "fields.toml"
+    config_path.write_text(config_contents, encoding="utf-8")
+
+    monkeypatch.setenv("CONFIG_PATH", str(config_path))
+    monkeypatch.delenv("PORT", raising=False)
+    monkeypatch.delenv("CONTEXT_MAX_CHARS", raising=False)
+    monkeypatch.setenv("CONTEXT_MAX_TURNS", "7")
+
+    settings = Settings()
+
+    assert settings.port == 9001
+    assert settings.context_max_chars == 1234
+    assert settings.context_max_turns == 7
+
+
+@pytest.mark.parametrize("name", ["CONTEXT_MAX_TURNS", "CONTEXT_MAX_CHARS"])
+def test_settings_reject_non_positive_context_limits(tmp_path, monkeypatch, name):
+    monkeypatch.setenv("CONFIG_PATH", str(tmp_path / "missing.toml"))
+    monkeypatch.setenv(name, "0")
+
+    with pytest.raises(ValidationError):
+        Settings()
+
+
+@pytest.mark.parametrize(("name", "value"), [("COMPRESSION_LEVEL", "12"), ("COMPRESSION_MIN_SIZE", "-1")])
+def test_settings_reject_invalid_compression_options(tmp_path, monkeypatch, name, value):
+    monkeypatch.setenv("CONFIG_PATH", str(tmp_path / "missing.toml"))
+    monkeypatch.setenv(name, value)
+
+    with pytest.raises(ValidationError):
+        Settings()
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+from __future__ import annotations
+
+import pytest
+
+from app.metabolism import generate_question, get_pending_question, ingest_reply
+
+
+def test_in_memory_metabolism_cycle(test_logger, stub_ai_client, seeded_repository) -> None:
+    repository = seeded_repository()
+
+    question = generate_question(test_logger, stub_ai_client, repository)
+    assert generate_question(test_logger, stub_ai_client, repository) is question
+
+    payload = ingest_reply(test_logger, stub_ai_client, repository, question.id, "calm evening")
+
+    assert question.status == "answered"
+    assert payload["memories_count"] == 1
+    assert payload["last_reflection"] is not None
+    pending = get_pending_question(repository)
+    assert pending is not None and pending.id != question.id
+    assert payload["state"] == {"mood": "grounded", "curiosity": repository.ensure_state().curiosity}
+
+
+def test_in_memory_rejects_answered_question(test_logger, stub_ai_client, seeded_repository) -> None:
+    repository = seeded_repository(1)
+
+    for question_id in (1, 999):
+        with pytest.raises(ValueError):
+            ingest_reply(test_logger, stub_ai_client, repository, question_id, "again")